@@ -8,21 +8,30 @@ Usage:
 `python example.py`
 
 """
+import logging
+
 from toggl import Toggl
+from toggl.toggl import REPORT_COLUMNS
+
+# show the verbose progress messages on the console
+logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 toggl = Toggl(verbose=True)
 
-toggl.report(start="2018-08-10")
+# The simple report is a column subset of the detailed report, so fetch the
+# detailed report once and slice it rather than requesting every page twice.
+detailed_report = toggl.detailed_report(start="2018-08-10")
+simple_report = detailed_report[REPORT_COLUMNS]
 
-# detailed_report = toggl.detailed_report(start='2018-01-01', end='2018-01-15')
-# simple_report = toggl.report(start='2018-01-01', end='2018-01-15')
-# intacct_format = toggl.intacct_report(start='2018-01-01', end='2018-01-15')
-#
-# print('\n\ndetailed_report\n')
-# print(detailed_report)
+print("\n\ndetailed_report\n")
+print(detailed_report)
+
+print("\n\nsimple_report\n")
+print(simple_report)
+
+# from toggl.intacct.intacct import IntacctToggl
 #
-# print('\n\nsimple_report\n')
-# print(simple_report)
+# intacct_format = IntacctToggl().intacct_report(start='2018-01-01', end='2018-01-15')
 #
 # print('\n\nintacct_format\n')
 # print(intacct_format)
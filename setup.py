@@ -9,8 +9,12 @@ setup(
     packages=find_packages(),
     install_requires=[
         "certifi==2018.1.18",
-        "pandas==0.22.0",
+        "requests>=2.20",
+        "urllib3>=1.26",
+        "numpy>=1.17",
+        "pandas>=0.24",
         "pyaml==17.12.1",
+        "PyYAML>=5.1",
         "dateparser==0.6.0",
     ],
 )
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+# the driver needs splinter and selenium, which only the browser tooling installs
+driver = pytest.importorskip("toggl.intacct.driver")
+
+
+class FakeInput(object):
+    def __init__(self):
+        self.value = None
+        self.clicked = False
+
+    def fill(self, value):
+        self.value = value
+
+    def click(self):
+        self.clicked = True
+
+
+class FakeDriver(object):
+    def __init__(self, filled=None):
+        self.filled = filled
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        if self.filled is None:
+            raise driver.WebDriverException("script blocked")
+        return self.filled
+
+
+class FakeIframe(object):
+    def __init__(self, inputs=0, filled=None):
+        self.driver = FakeDriver(filled)
+        self.inputs = [FakeInput() for _ in range(inputs)]
+        self.selectors = []
+
+    def find_by_css(self, selector):
+        self.selectors.append(selector)
+        return self.inputs
+
+
+def test_fill_hours_uses_one_script_call(capsys):
+    iframe = FakeIframe(filled=2)
+
+    driver.fill_hours(iframe, [1.5, 2], 3)
+
+    assert iframe.driver.scripts == [(3, ["1.5", "2"])]
+    assert iframe.selectors == []
+    assert capsys.readouterr().out == ""
+
+
+def test_fill_hours_falls_back_to_typing():
+    iframe = FakeIframe(inputs=2)
+
+    driver.fill_hours(iframe, [1.5, 2], 3)
+
+    assert iframe.selectors == ['input[id^="_obj__TIMESHEETITEMS_3_-_obj__DAY_"]']
+    assert [i.value for i in iframe.inputs] == ["1.5", "2"]
+    assert all(i.clicked for i in iframe.inputs)
+
+
+def test_fill_hours_warns_about_a_short_row(capsys):
+    iframe = FakeIframe(inputs=1)
+
+    driver.fill_hours(iframe, [1.5, 2], 0)
+
+    assert [i.value for i in iframe.inputs] == ["1.5"]
+    assert "more days in your data" in capsys.readouterr().out
+
+
+def test_fill_hours_warns_when_the_script_runs_short(capsys):
+    driver.fill_hours(FakeIframe(filled=1), [1.5, 2], 0)
+
+    assert "more days in your data" in capsys.readouterr().out
+
+
+def test_parse_intacct_date_reads_intacct_format():
+    assert driver.parse_intacct_date("06/30/2018") == date(2018, 6, 30)
+
+
+def test_parse_intacct_date_falls_back_to_dateparser():
+    assert driver.parse_intacct_date("June 30, 2018") == date(2018, 6, 30)
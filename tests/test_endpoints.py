@@ -2,10 +2,15 @@ from toggl.endpoints import Endpoints
 
 
 def test_static_endpoints():
+    assert Endpoints.ME == "https://www.toggl.com/api/v8/me"
     assert Endpoints.WORKSPACES == "https://www.toggl.com/api/v8/workspaces"
     assert Endpoints.CLIENTS == "https://www.toggl.com/api/v8/clients"
     assert Endpoints.PROJECTS == "https://www.toggl.com/api/v8/projects"
     assert Endpoints.REPORT_DETAILED == "https://toggl.com/reports/api/v2/details"
+    assert (
+        Endpoints.REPORT_DETAILED_CSV
+        == "https://toggl.com/reports/api/v2/details.csv"
+    )
     assert Endpoints.REPORT_SUMMARY == "https://toggl.com/reports/api/v2/summary"
     assert Endpoints.START_TIME == "https://www.toggl.com/api/v8/time_entries/start"
     assert Endpoints.TIME_ENTRIES == "https://www.toggl.com/api/v8/time_entries"
@@ -32,3 +37,8 @@ def test_client_projects():
         Endpoints.CLIENT_PROJECTS(1)
         == "https://www.toggl.com/api/v8/clients/1/projects"
     )
+
+
+def test_parameterized_endpoints_are_memoized():
+    assert Endpoints.CLIENT_PROJECTS(2) is Endpoints.CLIENT_PROJECTS(2)
+    assert Endpoints.CLIENT_PROJECTS(2) != Endpoints.CLIENT_PROJECTS(3)
@@ -1,4 +1,23 @@
-from toggl.intacct.intacct import IntacctToggl
+import io
+
+import pandas as pd
+import pytest
+import yaml
+
+from toggl.endpoints import Endpoints
+from toggl.intacct.intacct import IntacctCodes, IntacctToggl
+
+CODES = {
+    "Acme": {
+        "intacct_client": "C1",
+        "Web": {"intacct_project": "P1", "intacct_task": "T1"},
+        "Ops": {"intacct_project": "P2", "intacct_task": "T2"},
+    },
+    "Globex": {
+        "intacct_client": "C2",
+        "Web": {"intacct_project": "P3", "intacct_task": "T3"},
+    },
+}
 
 
 def test_can_instantiate():
@@ -32,3 +51,133 @@ def test_intacct_specific_methods_exist():
 
     for method in expected:
         assert method in dir(t)
+
+
+def test_map_intacct_codes():
+    t = IntacctToggl(email="email@foo.com", api_key="secret", workspace=99)
+    t.intacct_codes = IntacctCodes.from_mapping(CODES)
+    df = pd.DataFrame(
+        {"client": ["Globex", "Acme", "Acme"], "project": ["Web", "Ops", "Web"]}
+    )
+
+    result = t._map_intacct_codes(df)
+    assert list(result["client_code"]) == ["C2", "C1", "C1"]
+    assert list(result["project_code"]) == ["P3", "P2", "P1"]
+    assert list(result["task_code"]) == ["T3", "T2", "T1"]
+
+
+def test_map_intacct_codes_reports_unmapped_pairs(monkeypatch, capsys):
+    t = IntacctToggl(email="email@foo.com", api_key="secret", workspace=99)
+    t.intacct_codes = IntacctCodes.from_mapping(CODES)
+    monkeypatch.setattr(
+        IntacctToggl, "_show_missing_intacct_project_codes", lambda self: None
+    )
+    monkeypatch.setattr(
+        IntacctToggl, "_show_missing_intacct_client_codes", lambda self: None
+    )
+    df = pd.DataFrame(
+        {"client": ["Acme", "Acme", "Initech"], "project": ["Web", "Rnd", "Web"]}
+    )
+
+    with pytest.raises(RuntimeError):
+        t._map_intacct_codes(df)
+
+    out = capsys.readouterr().out
+    assert "2 client/project pairs" in out
+    assert "('Acme', 'Rnd'), ('Initech', 'Web')" in out
+
+
+def test_intacct_codes_from_mapping():
+    codes = IntacctCodes.from_mapping(CODES)
+    assert codes.raw is CODES
+    assert codes.lookup.loc[("Acme", "Ops")].tolist() == ["C1", "P2", "T2"]
+
+
+def test_intacct_code_getters():
+    t = IntacctToggl(email="email@foo.com", api_key="secret", workspace=99)
+    t.intacct_codes = IntacctCodes.from_mapping(CODES)
+
+    assert t._get_intacct_client_human_names() == ["Acme", "Globex"]
+    assert t._get_intacct_project_human_names() == ["Ops", "Web"]
+    assert t._get_intacct_client_codes() == ["C1", "C2"]
+    assert t._get_intacct_project_codes() == ["P1", "P2", "P3"]
+    assert t._get_intacct_task_codes() == ["T1", "T2", "T3"]
+
+
+def test_dump_intacct_code_map_template_round_trips():
+    stream = io.StringIO()
+    IntacctToggl._dump_intacct_code_map_template(CODES, stream)
+
+    dumped = stream.getvalue()
+    assert "Web: {intacct_project: P1, intacct_task: T1}" in dumped
+    assert yaml.safe_load(dumped) == CODES
+
+
+def test_code_mapping_is_loaded_once_per_file_version(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open("code_mapping.yml", "w") as f:
+        yaml.safe_dump(CODES, f)
+
+    first = IntacctToggl._load_intacct_code_mapping()
+    assert first.raw == CODES
+    assert IntacctToggl._load_intacct_code_mapping() is first
+
+    with open("code_mapping.yml", "w") as f:
+        yaml.safe_dump({"Acme": CODES["Acme"]}, f)
+
+    assert IntacctToggl._load_intacct_code_mapping().client_names == ("Acme",)
+
+
+def test_intacct_timesheet(monkeypatch):
+    t = IntacctToggl(email="email@foo.com", api_key="secret", workspace=99)
+    t.intacct_codes = IntacctCodes.from_mapping(CODES)
+    entries = pd.DataFrame(
+        {
+            "client": ["Acme", "Globex"],
+            "project": ["Ops", "Web"],
+            "start": ["2018-08-10T09:00:00-06:00", "2018-08-11T09:00:00-06:00"],
+            "end": ["2018-08-10T10:00:00-06:00", "2018-08-11T11:00:00-06:00"],
+        }
+    )
+    monkeypatch.setattr(
+        IntacctToggl, "report", lambda self, start, end: self._clean_times(entries)
+    )
+
+    timesheet = t._get_intacct_timesheet("2018-08-10", "2018-08-12")
+
+    assert timesheet.iloc[:, :3].values.tolist() == [
+        ["C1", "P2", "T2"],
+        ["C2", "P3", "T3"],
+    ]
+    assert timesheet.iloc[:, 3:].values.tolist() == [
+        [1.0, 0.0, 0.0],
+        [0.0, 2.0, 0.0],
+    ]
+
+
+def test_projects_by_client_uses_one_request(monkeypatch):
+    t = IntacctToggl(email="email@foo.com", api_key="secret", workspace=99)
+    calls = []
+    related = {
+        "clients": [{"id": 1, "name": "Acme"}, {"id": 2, "name": "Globex"}],
+        "projects": [
+            {"cid": 1, "name": "Web", "active": True},
+            {"cid": 1, "name": "Old", "active": False},
+            {"name": "No client", "active": True},
+        ],
+    }
+
+    def fake_request(self, endpoint, params=None):
+        calls.append((endpoint, params))
+        return {"data": related}
+
+    monkeypatch.setattr(IntacctToggl, "request", fake_request)
+
+    assert t._get_intacct_projects_by_client() == {
+        "Acme": {
+            "intacct_client": "CLIENT_CODE",
+            "Web": {"intacct_project": "PROJECT_CODE", "intacct_task": "TASK_CODE"},
+        },
+        "Globex": {"intacct_client": "CLIENT_CODE"},
+    }
+    assert calls == [(Endpoints.ME, {"with_related_data": "true"})]
@@ -1,10 +1,11 @@
 import contextlib
+import glob
 import os
 import shutil
 
 import pytest
 
-from toggl.utilities import load_config, load_yml_file
+from toggl.utilities import load_cached_yml_file, load_config, load_yml_file
 
 
 def test_load_config_raises_file_not_found_error_on_missing():
@@ -23,6 +24,48 @@ def test_load_config_returns_dict():
         safe_remove_file(fixture_yml)
 
 
+def test_load_cached_yml_file_tracks_changes():
+    fixture_yml = "test_cached.yml"
+    with open(fixture_yml, "w") as f:
+        f.write("foo: 'bar'\n")
+
+    try:
+        assert load_cached_yml_file(fixture_yml) == {"foo": "bar"}
+        assert len(glob.glob(".test_cached.*.json")) == 1
+        assert load_cached_yml_file(fixture_yml) == {"foo": "bar"}
+
+        with open(fixture_yml, "w") as f:
+            f.write("foo: 'bazinga'\n")
+
+        assert load_cached_yml_file(fixture_yml) == {"foo": "bazinga"}
+        assert len(glob.glob(".test_cached.*.json")) == 1
+    finally:
+        safe_remove_file(fixture_yml)
+        for cache_file in glob.glob(".test_cached.*.json"):
+            safe_remove_file(cache_file)
+
+
+def test_load_cached_yml_file_skips_keys_json_would_change():
+    fixture_yml = "test_keys.yml"
+    with open(fixture_yml, "w") as f:
+        f.write("2019: 'int key'\nyes: 'bool key'\n")
+
+    try:
+        expected = {2019: "int key", True: "bool key"}
+        assert load_cached_yml_file(fixture_yml) == expected
+        assert glob.glob(".test_keys.*.json") == []
+        assert load_cached_yml_file(fixture_yml) == expected
+    finally:
+        safe_remove_file(fixture_yml)
+        for cache_file in glob.glob(".test_keys.*.json"):
+            safe_remove_file(cache_file)
+
+
+def test_load_cached_yml_file_raises_file_not_found_error_on_missing():
+    with pytest.raises(FileNotFoundError):
+        load_cached_yml_file("fake_file_does_not_exist.yml")
+
+
 def safe_remove_file(filepath):
     """
     Silently remove a file or folder if it exists.
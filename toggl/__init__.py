@@ -1,3 +1,8 @@
+import logging
+
 from .toggl import Toggl
 
+# applications decide where the package's log messages go
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __all__ = ["Toggl"]
@@ -1,29 +1,39 @@
+from functools import lru_cache
+
 V8_BASE_URL = "https://www.toggl.com/api/v8"
+REPORTS_BASE_URL = "https://toggl.com/reports/api/v2"
 
 
 class Endpoints(object):
     """Endpoints for the toggl API."""
 
+    __slots__ = ()
+
+    ME = f"{V8_BASE_URL}/me"
     WORKSPACES = f"{V8_BASE_URL}/workspaces"
     CLIENTS = f"{V8_BASE_URL}/clients"
     PROJECTS = f"{V8_BASE_URL}/projects"
-    REPORT_DETAILED = "https://toggl.com/reports/api/v2/details"
-    REPORT_SUMMARY = "https://toggl.com/reports/api/v2/summary"
+    REPORT_DETAILED = f"{REPORTS_BASE_URL}/details"
+    REPORT_DETAILED_CSV = f"{REPORTS_BASE_URL}/details.csv"
+    REPORT_SUMMARY = f"{REPORTS_BASE_URL}/summary"
     START_TIME = f"{V8_BASE_URL}/time_entries/start"
     TIME_ENTRIES = f"{V8_BASE_URL}/time_entries"
     CURRENT_RUNNING_TIME = f"{V8_BASE_URL}/time_entries/current"
-    REPORT_WEEKLY = "https://toggl.com/reports/api/v2/weekly"
+    REPORT_WEEKLY = f"{REPORTS_BASE_URL}/weekly"
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def STOP_TIME(pid):
         """Get the stop time url."""
         url = f"{V8_BASE_URL}/time_entries/{str(pid)}/stop"
         return url
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def WORKSPACE_PROJECTS(id):
         return f"{V8_BASE_URL}/workspaces/{id}/projects"
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def CLIENT_PROJECTS(id):
         return f"{V8_BASE_URL}/clients/{id}/projects"
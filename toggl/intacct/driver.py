@@ -8,14 +8,17 @@ Before trying to run this you will need to install a chrome webdriver.
 Instructions are here:
 https://splinter.readthedocs.io/en/latest/drivers/chrome.html
 """
-import random
-import time
+import contextlib
+from datetime import date, datetime
 
 import dateparser
+import numpy as np
 import pandas as pd
 import splinter
-from selenium.common.exceptions import NoSuchFrameException
-from splinter.exceptions import ElementDoesNotExist
+from selenium.common.exceptions import NoSuchFrameException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 import toggl.utilities as utils
 from toggl.intacct.intacct import IntacctToggl
@@ -33,19 +36,23 @@ def load_config():
     return email, intacct_url
 
 
+_rng = np.random.default_rng()
+
+
 def fake_hours(days):
-    return [round(random.random() * 4, 2) for _ in range(days)]
+    return np.round(_rng.random(days) * 4, 2).tolist()
 
 
 def fake_data(days, rows):
+    hours = np.round(_rng.random((rows, days)) * 4, 2).tolist()
     return [
         {
             "customer": "C00008--Health Catalyst Internal",
             "project": "P00758--Operations",
             "task": "2621--Administrative",
-            "hours": fake_hours(days),
+            "hours": row_hours,
         }
-        for _ in range(rows)
+        for row_hours in hours
     ]
 
 
@@ -66,9 +73,17 @@ def verify_data_matches_intacct_days(browser, data):
         )
 
 
+def parse_intacct_date(date_string):
+    """Parse a date the way intacct renders it, falling back to dateparser."""
+    try:
+        return datetime.strptime(date_string, "%m/%d/%Y").date()
+    except ValueError:
+        return dateparser.parse(date_string).date()
+
+
 def count_days_in_pay_period(browser, start_date):
-    end = dateparser.parse(get_end_date(browser))
-    start = dateparser.parse(start_date)
+    end = parse_intacct_date(get_end_date(browser))
+    start = date.fromisoformat(start_date)
     delta = end - start
     return delta.days
 
@@ -78,96 +93,131 @@ def fill_start_date(browser, date):
         iframe.find_by_css("input#_obj__BEGINDATE").fill(date)
         # click on another element to force date load
         iframe.find_by_css("#_obj__DESCRIPTION").click()
+        # intacct fills in the end date once the start date has loaded
+        wait_for_css(iframe, "#_obj__ENDDATE")
+
+
+def fill_customer(iframe, customer, index):
+    iframe.find_by_css(
+        "input#_obj__TIMESHEETITEMS_{}_-_obj__CUSTOMERID".format(index)
+    ).fill(customer)
+
+
+def fill_project(iframe, project, index):
+    iframe.find_by_css(
+        "input#_obj__TIMESHEETITEMS_{}_-_obj__PROJECTID".format(index)
+    ).fill(project)
+
+
+def fill_task(iframe, task, index):
+    iframe.find_by_css(
+        "input#_obj__TIMESHEETITEMS_{}_-_obj__TASKKEY".format(index)
+    ).fill(task)
+
+
+# Sets every day input of a row in one WebDriver call. Returns the number of
+# inputs filled so a short row can be reported.
+FILL_HOURS_SCRIPT = """
+var prefix = "input#_obj__TIMESHEETITEMS_" + arguments[0] + "_-_obj__DAY_";
+var hours = arguments[1];
+for (var i = 0; i < hours.length; i++) {
+    var el = document.querySelector(prefix + i);
+    if (el === null) {
+        return i;
+    }
+    el.value = hours[i];
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+    el.dispatchEvent(new Event("blur", {bubbles: true}));
+}
+return hours.length;
+"""
 
 
-def fill_customer(browser, customer, index):
+def fill_hours(iframe, hours, index):
+    """Fill a row of hours with one script call, typing them if that fails."""
+    # For some reason floats can't be typed by splinter, so cast to str
+    hours = [str(h) for h in hours]
     try:
-        with browser.get_iframe("iamain") as iframe:
-            iframe.find_by_css(
-                "input#_obj__TIMESHEETITEMS_{}_-_obj__CUSTOMERID".format(index)
-            ).fill(customer)
-            print("customer iframe worked")
-    except NoSuchFrameException:
-        browser.find_by_css(
-            "input#_obj__TIMESHEETITEMS_{}_-_obj__CUSTOMERID".format(index)
-        ).fill(customer)
-        print("customer browser worked")
+        filled = iframe.driver.execute_script(FILL_HOURS_SCRIPT, index, hours)
+    except WebDriverException:
+        filled = type_hours(iframe, hours, index)
+
+    if filled < len(hours):
+        print(
+            "Please check your data. There are more days in your data "
+            "than there are fields in intacct."
+        )
 
 
-def fill_project(browser, project, index):
-    try:
-        with browser.get_iframe("iamain") as iframe:
-            iframe.find_by_css(
-                "input#_obj__TIMESHEETITEMS_{}_-_obj__PROJECTID".format(index)
-            ).fill(project)
-            print("project iframe worked")
-    except NoSuchFrameException:
-        browser.find_by_css(
-            "input#_obj__TIMESHEETITEMS_{}_-_obj__PROJECTID".format(index)
-        ).fill(project)
-        print("project browser worked")
+def type_hours(iframe, hours, index):
+    """Type a row of hours one input at a time and return how many fit."""
+    # one query for every day input of the row, in document order
+    day_inputs = iframe.find_by_css(
+        f'input[id^="_obj__TIMESHEETITEMS_{index}_-_obj__DAY_"]'
+    )
+    for day_input, h in zip(day_inputs, hours):
+        day_input.fill(h)
+        day_input.click()
 
+    return min(len(day_inputs), len(hours))
+
+
+def wait_for_css(browser, selector, timeout=5, poll=0.05):
+    """Block until the element matching a css selector is clickable."""
+    WebDriverWait(browser.driver, timeout, poll_frequency=poll).until(
+        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+    )
+
+
+def field_selector(field, index):
+    return "input#_obj__TIMESHEETITEMS_{}_-_obj__{}".format(index, field)
+
+
+def wait_for_field(iframe, field, index, timeout=5):
+    """Wait for a timesheet row field to be enabled instead of sleeping."""
+    wait_for_css(iframe, field_selector(field, index), timeout=timeout)
+
+
+def focus_field(iframe, field, index):
+    """Focus a timesheet row field without typing into it."""
+    iframe.driver.execute_script(
+        "document.querySelector(arguments[0]).focus();", field_selector(field, index)
+    )
 
-def fill_task(browser, task, index):
-    try:
-        with browser.get_iframe("iamain") as iframe:
-            iframe.find_by_css(
-                "input#_obj__TIMESHEETITEMS_{}_-_obj__TASKKEY".format(index)
-            ).fill(task)
-            print("task iframe worked")
-    except NoSuchFrameException:
-        browser.find_by_css(
-            "input#_obj__TIMESHEETITEMS_{}_-_obj__TASKKEY".format(index)
-        ).fill(task)
-        print("task browser worked")
+
+def fill_row(browser, index, customer, project, task, hours):
+    with contextlib.ExitStack() as stack:
+        # switch into the iframe once for the whole row
+        try:
+            iframe = stack.enter_context(browser.get_iframe("iamain"))
+        except NoSuchFrameException:
+            iframe = browser
+
+        fill_customer(iframe, customer, index)
+        focus_field(iframe, "PROJECTID", index)  # blur customer to force loading
+        wait_for_field(iframe, "PROJECTID", index)
+        fill_project(iframe, project, index)
+        focus_field(iframe, "TASKKEY", index)  # blur project to force loading
+        wait_for_field(iframe, "TASKKEY", index)
+        fill_task(iframe, task, index)
+        wait_for_field(iframe, "DAY_0", index)
+        fill_hours(iframe, hours, index)
 
 
-def fill_hours(browser, hours, index):
+def process_row(browser, index, customer, project, task, hours):
+    """Focus a timesheet row then fill it."""
     try:
         with browser.get_iframe("iamain") as iframe:
-            try:
-                for i, h in enumerate(hours):
-                    selector = "input#_obj__TIMESHEETITEMS_{}_-_obj__DAY_{}".format(
-                        index, i
-                    )
-                    temp_input = iframe.find_by_css(selector)
-                    # For some reason floats can't be typed by splinter, so cast to str
-                    temp_input.fill(str(h))
-                    temp_input.click()
-            except (IndexError, ElementDoesNotExist, AttributeError) as e:
-                print(
-                    "Please check your data. There are more days in your data "
-                    "than there are fields in intacct."
-                )
-            print("hours iframe worked")
+            iframe.find_by_css(
+                "#_obj__TIMESHEETITEMS_{}_-_obj__CUSTOMERID".format(index)
+            ).click()
+            print("preclick iframe worked")
     except NoSuchFrameException:
-        try:
-            for i, h in enumerate(hours):
-                selector = "input#_obj__TIMESHEETITEMS_{}_-_obj__DAY_{}".format(
-                    index, i
-                )
-                temp_input = browser.find_by_css(selector)
-                # For some reason floats can't be typed by splinter, so cast to str
-                temp_input.fill(str(h))
-                temp_input.click()
-        except (IndexError, ElementDoesNotExist, AttributeError) as e:
-            print(
-                "Please check your data. There are more days in your data "
-                "than there are fields in intacct."
-            )
-        print("hours browser worked")
-
-
-def fill_row(browser, index, customer, project, task, hours, delay=3):
-    fill_customer(browser, customer, index)
-    fill_project(browser, "", index)  # focus next field to force loading
-    time.sleep(delay)
-    fill_project(browser, project, index)
-    fill_task(browser, "", index)  # focus next field to force loading
-    time.sleep(delay)
-    fill_task(browser, task, index)
-    time.sleep(delay)
-    fill_hours(browser, hours, index)
+        browser.find_by_css(
+            "#_obj__TIMESHEETITEMS_{}_-_obj__CUSTOMERID".format(index)
+        ).click()
+        print("preclick browser worked")
+    fill_row(browser, index, customer, project, task, hours)
 
 
 def save_draft(browser):
@@ -176,24 +226,34 @@ def save_draft(browser):
         draft.click()
 
 
-def listify_hours(series):
-    return [
-        round(x, 2)
-        for x in series.drop(labels=["client_code", "project_code", "task_code"])
-    ]
-
-
 def bypass_update_screen(browser):
     if browser.is_text_present("Do not show this message again"):
-        browser.find_by_css('input.submit_button[value="Continue"]').click()
-        time.sleep(3)
+        continue_button = 'input.submit_button[value="Continue"]'
+        browser.find_by_css(continue_button).click()
+        WebDriverWait(browser.driver, 10).until(
+            EC.invisibility_of_element_located((By.CSS_SELECTOR, continue_button))
+        )
 
 
 def create_new_timecard(browser):
     browser.find_by_text("Time & Expenses").mouse_over()
-    time.sleep(1)
+    browser.is_element_present_by_css('span[menuitemrefno="57"]', wait_time=5)
     browser.find_by_css('span[menuitemrefno="57"]').click()
-    time.sleep(2)
+    wait_for_timecard(browser)
+
+
+def wait_for_timecard(browser, timeout=10):
+    """Wait for the new timecard's start date field instead of sleeping."""
+    driver = browser.driver
+    WebDriverWait(driver, timeout).until(
+        EC.frame_to_be_available_and_switch_to_it("iamain")
+    )
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#_obj__BEGINDATE"))
+        )
+    finally:
+        driver.switch_to.default_content()
 
 
 def total_hours(df):
@@ -210,9 +270,19 @@ def total_hours(df):
     return round(total, 2)
 
 
-if __name__ == "__main__":
-    start_date = "2018-06-16"
-    end_date = "2018-06-30"
+def main(start_date, end_date, browser=None):
+    """
+    Build a timesheet from toggl and type it into a new intacct timecard.
+
+    Args:
+        start_date (str): The start date in 'YYYY-MM-DD' format
+        end_date (str): The end date in 'YYYY-MM-DD' format
+        browser (splinter.Browser): An existing browser to drive. A new
+            chrome browser is started when omitted.
+
+    Returns:
+        splinter.Browser: The browser used, left open for review.
+    """
     email, url = load_config()
 
     # ## Load Data From Toggl
@@ -223,14 +293,15 @@ if __name__ == "__main__":
     total_hours(df)
 
     # ## Computer, create my timesheet.
-    browser = splinter.Browser("chrome")
+    if browser is None:
+        browser = splinter.Browser("chrome")
     browser.visit(url)
 
-    while len(browser.find_by_css("#okta-signin-username")) != 1:
-        time.sleep(1)
-    else:
-        browser.find_by_css("#okta-signin-username").fill(email)
-        browser.find_by_css("#okta-signin-password").fill("")
+    WebDriverWait(browser.driver, 60).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "#okta-signin-username"))
+    )
+    browser.find_by_css("#okta-signin-username").fill(email)
+    browser.find_by_css("#okta-signin-password").fill("")
 
     print("Please login")
     # input('Press enter after you are logged in.')
@@ -238,31 +309,26 @@ if __name__ == "__main__":
     bypass_update_screen(browser)
     create_new_timecard(browser)
 
-    fill_start_date(browser, dateparser.parse(start_date).strftime("%m/%d/%Y"))
-    time.sleep(2)
+    intacct_start_date = date.fromisoformat(start_date).strftime("%m/%d/%Y")
+    fill_start_date(browser, intacct_start_date)
     print(get_end_date(browser))
-    time.sleep(1)
 
-    fill_start_date(browser, dateparser.parse(start_date).strftime("%m/%d/%Y"))
+    fill_start_date(browser, intacct_start_date)
 
-    for i, row in df.iterrows():
-        try:
-            with browser.get_iframe("iamain") as iframe:
-                iframe.find_by_css(
-                    "#_obj__TIMESHEETITEMS_{}_-_obj__CUSTOMERID".format(i)
-                ).click()
-                print("preclick iframe worked")
-        except NoSuchFrameException:
-            browser.find_by_css(
-                "#_obj__TIMESHEETITEMS_{}_-_obj__CUSTOMERID".format(i)
-            ).click()
-            print("preclick browser worked")
-        fill_row(
-            browser,
-            i,
-            row["client_code"],
-            row["project_code"],
-            row["task_code"],
-            listify_hours(row),
-            delay=1,
-        )
+    code_columns = ["client_code", "project_code", "task_code"]
+    hours = np.round(df.drop(columns=code_columns).to_numpy(dtype=np.float64), 2)
+    rows = zip(
+        df["client_code"].tolist(),
+        df["project_code"].tolist(),
+        df["task_code"].tolist(),
+        hours.tolist(),
+    )
+
+    for i, (customer, project, task, row_hours) in enumerate(rows):
+        process_row(browser, i, customer, project, task, row_hours)
+
+    return browser
+
+
+if __name__ == "__main__":
+    main("2018-06-16", "2018-06-30")
@@ -1,11 +1,109 @@
+import logging
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import pandas as pd
 import yaml
 
 import toggl
 
+logger = logging.getLogger(__name__)
+
 INTACCT_CODE_MAPPING_FILENAME = "code_mapping.yml"
+INTACCT_CODE_MAPPING_MISSING = f"No code mapping file found. Please see the docs and create a {INTACCT_CODE_MAPPING_FILENAME} file"
+
+
+class _FlowMapping(dict):
+    """A mapping emitted inline, e.g. the project & task codes of a project."""
+
+
+class _TemplateDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    pass
+
+
+_TemplateDumper.add_representer(
+    _FlowMapping,
+    lambda dumper, data: dumper.represent_mapping(
+        "tag:yaml.org,2002:map", data, flow_style=True
+    ),
+)
+
+
+@dataclass(frozen=True)
+class IntacctCodes:
+    """A loaded code mapping along with every view derived from it."""
+
+    raw: dict
+    client_names: tuple
+    project_names: tuple
+    client_codes: tuple
+    project_codes: tuple
+    task_codes: tuple
+    lookup: pd.DataFrame = field(compare=False, repr=False)
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Build all of the views of a code mapping in a single pass."""
+        client_names = set()
+        project_names = set()
+        client_codes = set()
+        project_codes = set()
+        task_codes = set()
+        rows = []
+
+        for client, projects in mapping.items():
+            client_code = projects["intacct_client"]
+            client_names.add(client)
+            client_codes.add(client_code)
+            for project, codes in projects.items():
+                if project != "intacct_client":
+                    project_names.add(project)
+                    project_codes.add(codes["intacct_project"])
+                    task_codes.add(codes["intacct_task"])
+                    rows.append(
+                        (
+                            client,
+                            project,
+                            client_code,
+                            codes["intacct_project"],
+                            codes["intacct_task"],
+                        )
+                    )
+
+        lookup = pd.DataFrame(
+            rows,
+            columns=["client", "project", "client_code", "project_code", "task_code"],
+        )
+
+        return cls(
+            raw=mapping,
+            client_names=tuple(sorted(client_names)),
+            project_names=tuple(sorted(project_names)),
+            client_codes=tuple(sorted(client_codes)),
+            project_codes=tuple(sorted(project_codes)),
+            task_codes=tuple(sorted(task_codes)),
+            lookup=lookup.set_index(["client", "project"]),
+        )
+
+
+@lru_cache(maxsize=8)
+def _load_intacct_codes(path, mtime_ns, size):
+    """
+    Load a code mapping once per process for each version of the file.
+
+    mtime_ns and size are included in the cache key so an edited file
+    invalidates the cached entry and is loaded again.
+    """
+    code_mappings = toggl.utilities.load_cached_yml_file(
+        path, error_message=INTACCT_CODE_MAPPING_MISSING
+    )
+    return IntacctCodes.from_mapping(code_mappings)
 
 
 class IntacctToggl(toggl.Toggl):
+    __slots__ = ("intacct_codes", "intacct_clients", "intacct_projects")
+
     def __init__(self, **kwds):
         super().__init__(**kwds)
         self.intacct_codes = None
@@ -32,14 +130,17 @@ class IntacctToggl(toggl.Toggl):
             with one row per client-project-task.
         """
         self.intacct_codes = self._load_intacct_code_mapping()
-        print("Loaded mapping")
+        if self._verbose:
+            logger.info("Loaded mapping")
 
         self.intacct_clients = self._get_intacct_client_human_names()
         self.intacct_projects = self._get_intacct_project_human_names()
-        print("Loaded clients and projects.")
+        if self._verbose:
+            logger.info("Loaded clients and projects.")
 
         df = self._get_intacct_timesheet(start, end)
-        print("Got timesheet")
+        if self._verbose:
+            logger.info("Got timesheet")
 
         if save_csv:
             self._save_csv(df)
@@ -58,18 +159,19 @@ class IntacctToggl(toggl.Toggl):
 
     @staticmethod
     def _load_intacct_code_mapping():
-        code_mappings = toggl.utilities.load_yml_file(
-            INTACCT_CODE_MAPPING_FILENAME,
-            error_message=f"No code mapping file found. Please see the docs and create a {INTACCT_CODE_MAPPING_FILENAME} file",
-        )
+        path = os.path.abspath(INTACCT_CODE_MAPPING_FILENAME)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(INTACCT_CODE_MAPPING_MISSING)
 
-        return code_mappings
+        return _load_intacct_codes(path, stat.st_mtime_ns, stat.st_size)
 
     def _build_intacct_code_map_template(self):
         template = self._get_intacct_projects_by_client()
 
         with open(INTACCT_CODE_MAPPING_FILENAME, "w") as outfile:
-            yaml.dump(template, outfile, default_flow_style=False)
+            self._dump_intacct_code_map_template(template, outfile)
 
         print(
             f"""
@@ -84,6 +186,24 @@ class IntacctToggl(toggl.Toggl):
         )
         return template
 
+    @staticmethod
+    def _dump_intacct_code_map_template(template, stream):
+        """Write the template with each project's codes on a single line."""
+        flow_template = {
+            client: {
+                key: _FlowMapping(value) if isinstance(value, dict) else value
+                for key, value in projects.items()
+            }
+            for client, projects in template.items()
+        }
+        yaml.dump(
+            flow_template,
+            stream,
+            Dumper=_TemplateDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
     def _get_intacct_timesheet(self, start, end):
         """Get toggle entries and pivot them to an intacct timesheet format."""
         header_columns = ["client_code", "project_code", "task_code"]
@@ -91,18 +211,20 @@ class IntacctToggl(toggl.Toggl):
         encoded = self._map_intacct_codes(reshaped)
         return self._add_missing_date_columns(start, end, header_columns, encoded)
 
-    def _intacct_code_lookup(self, row):
-        """Lookup Intacct billing codes."""
-        client = self.intacct_codes[row["client"]]
-        c_id = client["intacct_client"]
-        project = client[row["project"]]
-        p_id = project["intacct_project"]
-        t_id = project["intacct_task"]
-
-        return c_id, p_id, t_id
+    @staticmethod
+    def _show_unmapped_client_projects(unmapped):
+        pairs = sorted(set(zip(unmapped["client"], unmapped["project"])))
+        print(
+            "\nWARNING! Your code mapping file has no codes for "
+            "{} client/project pairs in this timesheet. Please add them and "
+            "try again.".format(len(pairs))
+        )
+        print(pairs)
 
     def _show_missing_intacct_project_codes(self):
-        missing_projects = set(self.toggl_projects) - set(self.intacct_projects)
+        missing_projects = set(self.toggl_projects).difference(
+            self.intacct_codes.project_names
+        )
         if len(missing_projects) > 0:
             print(
                 "\nWARNING! Your code mapping file is missing entries for "
@@ -113,7 +235,9 @@ class IntacctToggl(toggl.Toggl):
 
     def _show_missing_intacct_client_codes(self):
         toggl_client_names = [c["name"] for c in self.clients]
-        missing_clients = set(toggl_client_names) - set(self.intacct_clients)
+        missing_clients = set(toggl_client_names).difference(
+            self.intacct_codes.client_names
+        )
         print(
             "\nWARNING! Your code mapping file is missing entries for "
             "{} clients that were found on Toggl. Please add them and try "
@@ -122,74 +246,50 @@ class IntacctToggl(toggl.Toggl):
         print(missing_clients)
 
     def _map_intacct_codes(self, df):
-        try:
-            df["client_code"] = None
-            df["project_code"] = None
-            df["task_code"] = None
-            df["client_code"], df["project_code"], df["task_code"] = zip(
-                *df.apply(self._intacct_code_lookup, axis=1)
-            )
-            return df
-        except KeyError as ke:
+        merged = df.join(self.intacct_codes.lookup, on=["client", "project"])
+        unmapped = merged[self.intacct_codes.lookup.columns].isnull().any(axis=1)
+
+        if unmapped.any():
+            self._show_unmapped_client_projects(merged[unmapped])
             self._show_missing_intacct_project_codes()
             self._show_missing_intacct_client_codes()
-            print(ke)
             raise RuntimeError(
                 "There was a problem mapping codes to projects and clients"
             )
 
+        return merged
+
     def _get_intacct_client_human_names(self):
         """Get a list of all unique intacct client human names."""
-        return list(set(self.intacct_codes.keys()))
+        return list(self.intacct_codes.client_names)
 
     def _get_intacct_project_human_names(self):
         """Get a list of all unique intacct project human names."""
-        projects = []
-        for k, v in self.intacct_codes.items():
-            for k2, v2 in v.items():
-                if k2 != "intacct_client":
-                    projects.append(k2)
-        return sorted(list(set(projects)))
+        return list(self.intacct_codes.project_names)
 
     def _get_intacct_client_codes(self):
         """Get a list of all unique intacct client codes."""
-        client_codes = []
-        for k, v in self.intacct_codes.items():
-            client_codes.append(v["intacct_client"])
-
-        return sorted(list(set(client_codes)))
+        return list(self.intacct_codes.client_codes)
 
     def _get_intacct_project_codes(self):
         """Get a list of all unique intacct project codes."""
-        project_codes = []
-        for k, v in self.intacct_codes.items():
-            for k2, v2 in v.items():
-                if k2 != "intacct_client":
-                    project_codes.append(v2["intacct_project"])
-        return sorted(list(set(project_codes)))
+        return list(self.intacct_codes.project_codes)
 
     def _get_intacct_task_codes(self):
         """Get a list of all unique intacct task codes."""
-        task_codes = []
-        for k, v in self.intacct_codes.items():
-            for k2, v2 in v.items():
-                if k2 != "intacct_client":
-                    task_codes.append(v2["intacct_task"])
-        return sorted(list(set(task_codes)))
+        return list(self.intacct_codes.task_codes)
 
     def _get_intacct_projects_by_client(self):
         """Get a dictionary of all projects by client."""
         projects_by_client = {}
 
-        for c in self.clients:
+        for c, projects in self._get_clients_with_projects():
             projects_by_client[c["name"]] = {"intacct_client": "CLIENT_CODE"}
-            projects = self._get_client_projects(c["id"])
-
-            if projects is not None:
-                for p in projects:
-                    projects_by_client[c["name"]][p["name"]] = {
-                        "intacct_project": "PROJECT_CODE",
-                        "intacct_task": "TASK_CODE",
-                    }
+
+            for p in projects:
+                projects_by_client[c["name"]][p["name"]] = {
+                    "intacct_project": "PROJECT_CODE",
+                    "intacct_task": "TASK_CODE",
+                }
 
         return projects_by_client
@@ -11,24 +11,142 @@ toggl = Toggl(YOUR_EMAIL, YOUR_API_KEY)
 toggl.intacct_format()
 ```
 """
-import json
+import glob
+import hashlib
+import io
+import logging
 import math
+import os
+import threading
 import time
 from base64 import b64encode
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 
 import certifi
-import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses bytes several times faster than the standard library; both
+# accept the raw response body so there is no need to decode it first.
+try:
+    import orjson as json
+except ImportError:
+    import json
 
 import toggl.utilities
-from toggl.endpoints import Endpoints
+from toggl.endpoints import REPORTS_BASE_URL, Endpoints
+
+logger = logging.getLogger(__name__)
+
+# numpy and pandas are imported inside the methods that build frames. They
+# take a few hundred milliseconds to load, which plain api calls never need.
+
+# One pooled session for the whole process so repeated calls to toggl reuse
+# their keep-alive connections instead of paying a new TLS handshake each time.
+# Credentials travel in each request's headers, never on the session.
+# Rate limited (429) and transient server errors are retried with exponential
+# backoff, honouring any Retry-After header toggl sends.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=_RETRY),
+)
+
+# certifi.where() can unpack its bundle to disk on first call; look it up once
+# per process rather than once per Toggl.
+_CAFILE = certifi.where()
+
+# Seconds to wait for toggl to connect or send data before giving up.
+REQUEST_TIMEOUT = 30
+
+TOGGL_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+TOGGL_LOCAL_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+# csv exports split dates and times and carry no utc offset
+TOGGL_CSV_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Seconds a cached response stays fresh. Clients and projects rarely change,
+# while report data can change as soon as someone stops a timer.
+METADATA_CACHE_TTL = 60 * 60
+REPORT_CACHE_TTL = 30
+
+# Reports that end before today are written to the optional disk cache and
+# reused until clear_cache(); open ranges only ever use the memory cache.
+DISK_CACHE_SUFFIX = ".toggl-report"
+
+# How many report pages may be in flight at once, and the minimum spacing in
+# seconds between starting them to meet toggl's safe api limits.
+# https://github.com/toggl/toggl_api_docs#the-api-format
+REPORT_PAGE_WORKERS = 4
+REPORT_PAGE_INTERVAL = 1
+
+# How many per-client project requests may be in flight at once when the
+# bulk /me request is unavailable.
+CLIENT_PROJECT_WORKERS = 4
+
+REPORT_COLUMNS = [
+    "client",
+    "project",
+    "description",
+    "start",
+    "end",
+    "duration_min",
+    "duration_hr",
+]
+
+
+class _RateLimiter(object):
+    """Hand out start times at most one per interval, shared across threads."""
+
+    __slots__ = ("_interval", "_lock", "_next")
+
+    def __init__(self, interval):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def wait(self, stop=None):
+        """Block until the caller's slot comes up, or until stop is set."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self._interval
+        # sleep outside the lock so later callers can claim their slots
+        if slot > now:
+            if stop is None:
+                time.sleep(slot - now)
+            else:
+                stop.wait(slot - now)
 
 
 class Toggl(object):
     """Toggl data class."""
 
-    def __init__(self, email=None, api_key=None, workspace=None, verbose=False):
+    __slots__ = (
+        "email",
+        "workspace",
+        "_api_key",
+        "_cache_dir",
+        "_cafile",
+        "_headers",
+        "_session",
+        "_verbose",
+        "_client_projects_cache",
+        "_metadata_cache",
+        "_metadata_lock",
+        "_response_cache",
+    )
+
+    def __init__(
+        self, email=None, api_key=None, workspace=None, verbose=False, cache_dir=None
+    ):
         """
         Create a Toggl object.
 
@@ -36,7 +154,11 @@ class Toggl(object):
             email (str): Your toggl email.
             api_key (str): Your toggl api_key.
             workspace (int): Your toggl workspace id
-            verbose (bool): Set to True if you want debugging output.
+            verbose (bool): Set to True if you want debugging output. Only
+                verbose instances log their progress, at INFO on the "toggl"
+                logger, which shows once the application configures logging.
+            cache_dir (str): A directory to keep reports of past date ranges
+                in, so rerunning them skips toggl. (default None, no disk cache)
         """
         if email is None and api_key is None and workspace is None:
             config = toggl.utilities.load_config()
@@ -51,13 +173,17 @@ class Toggl(object):
         self.email = email
         self.workspace = workspace
         self._api_key = api_key
-        self._cafile = certifi.where()
+        self._cache_dir = cache_dir
+        self._cafile = _CAFILE
+        self._headers = None
+        self._session = _SESSION
         self._verbose = verbose
 
-        # Statefulness
-        self._current_page = 1
-        self._pages = 1
-        self._current_records_acquired = 0
+        # Caches
+        self._client_projects_cache = {}
+        self._metadata_cache = {}
+        self._metadata_lock = threading.RLock()
+        self._response_cache = {}
 
     def __repr__(self):
         return f"Toggl(email={self.email}, api_key={self._api_key}, workspace={self.workspace}, verbose={self._verbose})"
@@ -65,15 +191,21 @@ class Toggl(object):
     @property
     def clients(self):
         """Get a list of all clients on Toggl."""
-        return self.request(Endpoints.CLIENTS, self.params)
+        return self._get_cached_metadata(
+            "clients", lambda: self.request(Endpoints.CLIENTS, self.params)
+        )
 
     @property
     def toggl_projects(self):
         """Get a list of all projects on Toggl."""
-        response = self.request(
-            Endpoints.WORKSPACE_PROJECTS(self.workspace), self.params
-        )
-        return [x["name"] for x in response]
+
+        def fetch():
+            response = self.request(
+                Endpoints.WORKSPACE_PROJECTS(self.workspace), self.params
+            )
+            return [x["name"] for x in response]
+
+        return self._get_cached_metadata("toggl_projects", fetch)
 
     @property
     def params(self):
@@ -81,15 +213,35 @@ class Toggl(object):
 
     @property
     def headers(self):
-        return {
-            "Authorization": self._build_api_auth(self._api_key),
-            "Content-Type": "application/json",
-            "Accept": "*/*",
-            "User-Agent": "python/urllib",
-        }
-
-    def detailed_report(self, start=None, end=None, params=None):
-        """Generate a dataframe that has all columns from Toggl."""
+        # the api key never changes, so the auth header is encoded only once
+        if self._headers is None:
+            self._headers = {
+                "Authorization": self._build_api_auth(self._api_key),
+                "Content-Type": "application/json",
+                "Accept": "*/*",
+                # already the requests default; spelled out so the compressed
+                # report pages don't hinge on the session's own headers
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "python/urllib",
+            }
+
+        return self._headers
+
+    def detailed_report(self, start=None, end=None, params=None, format="json"):
+        """
+        Generate a dataframe that has all columns from Toggl.
+
+        Args:
+            start (str): The start date in 'YYYY-MM-DD' format
+            end (str): The end date in 'YYYY-MM-DD' format
+            params (dict): Report parameters. (default self.params)
+            format (str): 'json' pages through every column toggl has, while
+                'csv' fetches the whole report in one export with only the
+                report columns. (default 'json')
+
+        Returns:
+            pandas.DataFrame: A dataframe with one row per time entry.
+        """
         if params is None:
             params = self.params
         if start:
@@ -97,42 +249,28 @@ class Toggl(object):
         if end:
             params["until"] = end
 
-        df = self._load_report_page(params)
-
-        while self._current_page < self._pages:
-            # hacky way of rate limiting to meet toggl safe api limits
-            # https://github.com/toggl/toggl_api_docs#the-api-format
-            time.sleep(1)
-            self._current_page += 1
-            params["page"] = self._current_page
-            df = pd.concat([df, self._load_report_page(params)])
-
-            df.reset_index(inplace=True, drop=True)
+        if format == "json":
+            df = self._load_report_json(params)
+        elif format == "csv":
+            df = self._load_report_csv(params)
+        else:
+            raise RuntimeError("Please specify a format of 'json' or 'csv'")
 
-        self._reset_instance_pagination()
+        # a single pass of time cleaning for the whole report
+        df = self._clean_times(df)
 
         if self._verbose:
-            print("Loaded {} records.".format(len(df)))
+            logger.info("Loaded %d records.", len(df))
 
         self._check_for_missing_clients_in_toggl(df)
 
         return df
 
-    def report(self, start=None, end=None, params=None):
+    def report(self, start=None, end=None, params=None, format="json"):
         """Generate a dataframe of selected columns from Toggl."""
-        df = self.detailed_report(start=start, end=end, params=params)
-
-        return df[
-            [
-                "client",
-                "project",
-                "description",
-                "start",
-                "end",
-                "duration_min",
-                "duration_hr",
-            ]
-        ]
+        df = self.detailed_report(start=start, end=end, params=params, format=format)
+
+        return df[REPORT_COLUMNS]
 
     def timesheet_report(self, start, end, save_csv=False):
         """
@@ -159,20 +297,129 @@ class Toggl(object):
 
     def request(self, endpoint, parameters=None):
         """Request an endpoint and return the data as a parsed JSON dict."""
-        return json.loads(self.request_raw(endpoint, parameters).decode("utf-8"))
+        return json.loads(self.request_raw(endpoint, parameters))
 
     def request_raw(self, endpoint, parameters=None):
-        """Request an endpoint and return raw data."""
-        if parameters is None:
-            return urlopen(
-                Request(endpoint, headers=self.headers), cafile=self._cafile
-            ).read()
-        else:
-            # encode all of our data for a get request & modify the URL
-            endpoint = endpoint + "?" + urlencode(parameters)
-            return urlopen(
-                Request(endpoint, headers=self.headers), cafile=self._cafile
-            ).read()
+        """
+        Request an endpoint and return raw data.
+
+        Responses are cached in memory for a while (see METADATA_CACHE_TTL and
+        REPORT_CACHE_TTL). If a metadata request fails, the last cached
+        response for it is returned instead, however old, with a warning.
+        A failed report request always raises. With a cache_dir, reports of
+        date ranges that ended before today are also kept on disk.
+        """
+        key = self._cache_key(endpoint, parameters)
+        content = self._cached_response(endpoint, key)
+        if content is not None:
+            return content
+
+        disk_path = self._disk_cache_path(endpoint, key)
+
+        try:
+            response = self._session.get(
+                endpoint,
+                params=parameters,
+                headers=self.headers,
+                verify=self._cafile,
+                timeout=REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+        except requests.RequestException:
+            # a stale report page would put old hours on a timesheet as if
+            # they were current, so only metadata falls back to the cache
+            fetched_at, cached = self._response_cache.get(key, (None, None))
+            if cached is None or endpoint.startswith(REPORTS_BASE_URL):
+                raise
+            logger.warning(
+                "Request to %s failed; using a cached response from %d seconds ago.",
+                endpoint,
+                time.monotonic() - fetched_at,
+            )
+            return cached
+
+        self._prune_response_cache()
+        self._response_cache[key] = (time.monotonic(), response.content)
+        if disk_path is not None:
+            # write then rename so a crash never leaves a truncated report
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(disk_path + ".tmp", "wb") as cache_file:
+                cache_file.write(response.content)
+            os.replace(disk_path + ".tmp", disk_path)
+
+        return response.content
+
+    def clear_cache(self):
+        """Forget every cached response, in memory and on disk."""
+        self._response_cache.clear()
+        self._client_projects_cache.clear()
+        with self._metadata_lock:
+            self._metadata_cache.clear()
+
+        if self._cache_dir is not None:
+            # .tmp files are writes a crash cut short
+            for suffix in (DISK_CACHE_SUFFIX, DISK_CACHE_SUFFIX + ".tmp"):
+                pattern = os.path.join(self._cache_dir, "*" + suffix)
+                for path in glob.glob(pattern):
+                    os.remove(path)
+
+    def _prune_response_cache(self):
+        """Drop expired report pages, which are never served again."""
+        now = time.monotonic()
+        # expired metadata stays as the stale-if-error fallback; there is only
+        # a handful of it, unlike report pages
+        for key, (fetched_at, _) in list(self._response_cache.items()):
+            if key[0].startswith(REPORTS_BASE_URL):
+                if now - fetched_at >= REPORT_CACHE_TTL:
+                    self._response_cache.pop(key, None)
+
+    def _has_cached_response(self, endpoint, parameters=None):
+        """Check if request_raw would answer without calling toggl."""
+        key = self._cache_key(endpoint, parameters)
+        return self._cached_response(endpoint, key) is not None
+
+    @staticmethod
+    def _cache_key(endpoint, parameters):
+        return (endpoint, tuple(sorted((parameters or {}).items())))
+
+    def _cached_response(self, endpoint, key):
+        """Get a fresh cached body from memory or disk, or None."""
+        fetched_at, cached = self._response_cache.get(key, (None, None))
+        if cached is not None:
+            if time.monotonic() - fetched_at < self._cache_ttl(endpoint):
+                return cached
+
+        disk_path = self._disk_cache_path(endpoint, key)
+        if disk_path is None:
+            return None
+
+        try:
+            with open(disk_path, "rb") as cache_file:
+                content = cache_file.read()
+        except FileNotFoundError:
+            return None
+
+        self._response_cache[key] = (time.monotonic(), content)
+        return content
+
+    @staticmethod
+    def _cache_ttl(endpoint):
+        if endpoint.startswith(REPORTS_BASE_URL):
+            return REPORT_CACHE_TTL
+        return METADATA_CACHE_TTL
+
+    def _disk_cache_path(self, endpoint, key):
+        """Get where a report lives on disk, or None if it shouldn't be kept."""
+        if self._cache_dir is None or not endpoint.startswith(REPORTS_BASE_URL):
+            return None
+
+        # entries in a range that is still open can change at any moment
+        until = dict(key[1]).get("until")
+        if until is None or str(until) >= date.today().isoformat():
+            return None
+
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self._cache_dir, digest + DISK_CACHE_SUFFIX)
 
     def _get_timesheet(self, start, end):
         """Get toggle entries and pivot them to a time sheet format."""
@@ -183,47 +430,149 @@ class Toggl(object):
     @staticmethod
     def _add_missing_date_columns(start, end, header_columns, df):
         """Fix missing date columnsl"""
-        header_columns = df[header_columns]
-        dates = df.select_dtypes(include="float64")
-        idx = pd.date_range(start, end)
-        fixed_dates = dates.reindex(idx, axis="columns", fill_value=0)
-        reordered = pd.concat(
-            [header_columns, fixed_dates], axis=1, join_axes=[df.index]
-        )
-        return reordered
+        import numpy as np
+        import pandas as pd
+
+        # everything the pivot didn't produce from a day is a known key column
+        non_date_columns = {"client", "project", *header_columns}
+        date_columns = [c for c in df.columns if c not in non_date_columns]
+        # the days carry toggl's utc offset, so the full range has to as well
+        idx = pd.date_range(start, end, tz=pd.DatetimeIndex(date_columns).tz)
+        # one reindex selects, orders and zero-fills every column at once; the
+        # float32 fill keeps added days the same dtype as the pivoted ones
+        return df.reindex(columns=[*header_columns, *idx], fill_value=np.float32(0))
 
     def _get_pivoted_timesheet_entries(self, end, start):
+        import numpy as np
+
         df = self.report(start=start, end=end)
-        print("Pivoting {} toggl time entry records.".format(len(df)))
-        df.set_index(df["start"], inplace=True)
-        resampled = (
-            df[["client", "project", "start", "duration_hr"]]
-            .groupby(["client", "project"])
-            .resample("D")
-            .sum()
-        )
-        pivot = resampled.pivot_table(
-            index=["client", "project"], columns="start", values="duration_hr"
-        )
-        reshaped = pivot.fillna(0).reset_index()
+        if self._verbose:
+            logger.info("Pivoting %d toggl time entry records.", len(df))
+        # bucket entries into days and sum them in one flat groupby; unlike
+        # resample this never materializes empty days for every group
+        days = df["start"].dt.floor("D").rename("start")
+        daily = df.groupby([df["client"], df["project"], days])["duration_hr"].sum()
+        # a day's hours need nowhere near float64 precision
+        pivot = daily.unstack("start", fill_value=0).astype(np.float32)
+        reshaped = pivot.reset_index()
         return reshaped
 
-    def _load_report_page(self, params):
-        response = self.request(Endpoints.REPORT_DETAILED, params)
+    def _load_report_json(self, params):
+        """Page through the detailed report and build one frame from it."""
+        import pandas as pd
+
+        # pagination state is local so overlapping reports can't clobber it
+        first_cached = self._has_cached_response(Endpoints.REPORT_DETAILED, params)
+        response = self._fetch_report_page(params)
+        pages = math.ceil(response["total_count"] / response["per_page"])
+        # each page is moved onto per-column lists as it arrives so its dicts
+        # can be freed instead of all piling up until the frame is built
+        columns = {}
+        acquired = self._append_columns(columns, response["data"])
+        self._log_page_progress(response, acquired, 1, pages)
+
+        if pages > 1:
+            # cached pages never reach toggl, so only real requests take slots;
+            # if page 1 has just gone out the next one waits a full interval
+            limiter = _RateLimiter(REPORT_PAGE_INTERVAL)
+            if not first_cached:
+                limiter.wait()
+
+            done = threading.Event()
+
+            def fetch(page):
+                page_params = {**params, "page": page}
+                endpoint = Endpoints.REPORT_DETAILED
+                if not self._has_cached_response(endpoint, page_params):
+                    limiter.wait(done)
+                # the report may have ended while this page waited for its slot
+                if done.is_set():
+                    return None
+                return self._fetch_report_page(page_params)
+
+            workers = min(REPORT_PAGE_WORKERS, pages - 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(fetch, page) for page in range(2, pages + 1)
+                ]
+
+                try:
+                    for index, page in enumerate(range(2, pages + 1)):
+                        response = futures[index].result()
+                        # the future would keep the page's dicts alive
+                        futures[index] = None
+                        acquired = self._append_columns(columns, response["data"])
+                        self._log_page_progress(response, acquired, page, pages)
+
+                        # a short page is the last one even if entries were
+                        # deleted since page 1
+                        if len(response["data"]) < response["per_page"]:
+                            break
+                finally:
+                    # after the last page or a failed one, drop the pages
+                    # still queued or waiting on slots
+                    done.set()
+                    for pending in futures:
+                        if pending is not None:
+                            pending.cancel()
+
+        return pd.DataFrame(columns)
+
+    def _load_report_csv(self, params):
+        """Fetch the detailed report as one csv export in the json schema."""
+        import pandas as pd
+
+        raw = self.request_raw(Endpoints.REPORT_DETAILED_CSV, params)
+        # the export is unpaginated and pandas parses it straight into typed
+        # columns, without a python dict per entry; toggl prefixes a bom
+        export = pd.read_csv(io.BytesIO(raw), encoding="utf-8-sig")
+
+        return pd.DataFrame(
+            {
+                "client": export["Client"],
+                "project": export["Project"],
+                "description": export["Description"],
+                "start": pd.to_datetime(
+                    export["Start date"] + " " + export["Start time"],
+                    format=TOGGL_CSV_TIME_FORMAT,
+                ),
+                "end": pd.to_datetime(
+                    export["End date"] + " " + export["End time"],
+                    format=TOGGL_CSV_TIME_FORMAT,
+                ),
+            }
+        )
 
-        record_count = response["total_count"]
-        self._pages = math.ceil(record_count / response["per_page"])
+    def _fetch_report_page(self, params):
+        """Request a single detailed report page without touching any state."""
+        return self.request(Endpoints.REPORT_DETAILED, params)
 
-        df = pd.DataFrame(response["data"])
-        df = self._clean_times(df)
-        self._current_records_acquired += len(df)
+    def _log_page_progress(self, response, acquired, page, pages):
+        record_count = response["total_count"]
 
         if self._verbose and record_count > response["per_page"]:
-            print(
-                f"{self._current_records_acquired} of {record_count} records acquired. {self._current_page} of {self._pages} pages needed."
+            logger.info(
+                "%d of %d records acquired. %d of %d pages needed.",
+                acquired,
+                record_count,
+                page,
+                pages,
             )
 
-        return df
+    @staticmethod
+    def _append_columns(columns, records):
+        """Append records onto per-column lists and return the total row count."""
+        rows = len(next(iter(columns.values()), ()))
+        # every key seen, in first-seen order, in case some entries lack one;
+        # a key first seen now is backfilled for the rows already appended
+        for key in dict.fromkeys(key for record in records for key in record):
+            if key not in columns:
+                columns[key] = [None] * rows
+
+        for column, values in columns.items():
+            values.extend(record.get(column) for record in records)
+
+        return rows + len(records)
 
     @staticmethod
     def _save_csv(df):
@@ -235,14 +584,44 @@ class Toggl(object):
     @staticmethod
     def _clean_times(df):
         """Convert string times to times and timedeltas."""
-        df["start"] = pd.to_datetime(df["start"])
-        df["end"] = pd.to_datetime(df["end"])
-        df["duration"] = df["end"] - df["start"]
-        df["duration_min"] = [x.seconds / 60 for x in df["duration"]]
-        df["duration_hr"] = [x.seconds / 3600 for x in df["duration"]]
+        import pandas as pd
+
+        # csv exports are parsed already, as local times without an offset
+        if pd.api.types.is_datetime64_any_dtype(df["start"]):
+            df["duration"] = df["end"] - df["start"]
+        else:
+            # each entry carries its own utc offset, which changes across a dst
+            # switch, so durations are measured on the absolute times...
+            start = pd.to_datetime(
+                df["start"], format=TOGGL_TIME_FORMAT, cache=True, utc=True
+            )
+            end = pd.to_datetime(
+                df["end"], format=TOGGL_TIME_FORMAT, cache=True, utc=True
+            )
+            df["duration"] = end - start
+            # ...while start and end keep each entry's own local wall time, so
+            # the timesheet books it on the calendar day it happened
+            df["start"] = Toggl._local_times(df["start"])
+            df["end"] = Toggl._local_times(df["end"])
+
+        # total_seconds stays vectorized and, unlike the raw int64 view, keeps
+        # a running timer's missing end as NaN instead of a huge negative
+        seconds = df["duration"].dt.total_seconds()
+        df["duration_min"] = seconds / 60.0
+        df["duration_hr"] = seconds / 3600.0
 
         return df
 
+    @staticmethod
+    def _local_times(times):
+        """Parse toggl time strings as local times, dropping their utc offset."""
+        import pandas as pd
+
+        # the wall time is the fixed-width prefix before the offset
+        return pd.to_datetime(
+            times.str[:19], format=TOGGL_LOCAL_TIME_FORMAT, cache=True
+        )
+
     @staticmethod
     def _build_api_auth(api_key):
         """
@@ -261,16 +640,43 @@ class Toggl(object):
         """Get the users workspaces."""
         return self.request(Endpoints.WORKSPACES)
 
-    def _reset_instance_pagination(self):
-        self._current_page = 1
-        self._pages = 1
-        self._current_records_acquired = 0
+    def _get_me_with_related_data(self):
+        """Get the user's workspaces, clients and projects in a single call."""
+        return self.request(Endpoints.ME, {"with_related_data": "true"})["data"]
+
+    def _get_clients_with_projects(self):
+        """Get a (client, projects) pair for every client on Toggl."""
+        try:
+            related = self._get_me_with_related_data()
+        except requests.RequestException:
+            return self._get_clients_with_projects_per_client()
+
+        clients = related.get("clients") or []
+        projects_by_client_id = {c["id"]: [] for c in clients}
+
+        for p in related.get("projects") or []:
+            # the per-client endpoint only ever listed active projects
+            if p.get("cid") in projects_by_client_id and p.get("active", True):
+                projects_by_client_id[p["cid"]].append(p)
+
+        return [(c, projects_by_client_id[c["id"]]) for c in clients]
+
+    def _get_clients_with_projects_per_client(self):
+        """Fall back to requesting each client's projects, several at a time."""
+        clients = self.clients or []
+
+        with ThreadPoolExecutor(max_workers=CLIENT_PROJECT_WORKERS) as executor:
+            projects = executor.map(
+                self._get_client_projects, [c["id"] for c in clients]
+            )
+            return [(c, p or []) for c, p in zip(clients, projects)]
 
     @staticmethod
     def _check_for_missing_clients_in_toggl(df):
-        if df["client"].isnull().sum():
+        missing = df["client"].isnull()
+        if missing.any():
             missing_client_entries = df.loc[
-                df["client"].isnull(), ["start", "description", "duration"]
+                missing, ["start", "description", "duration"]
             ]
             print(
                 f"""WARNING! The following {len(missing_client_entries)} 
@@ -291,6 +697,30 @@ client, please go to the web and add clients to entries without  them."""
 
         return [x["id"] for x in response]
 
+    def _get_cached_metadata(self, name, fetch):
+        """Fetch metadata once per workspace, even if several threads ask."""
+        key = (name, self.workspace)
+        # held across the fetch so concurrent callers wait for the first one
+        # instead of all requesting the same thing
+        with self._metadata_lock:
+            entry = self._metadata_cache.get(key)
+            # entries expire along with the cached responses they came from
+            if entry is None or time.monotonic() - entry[0] >= METADATA_CACHE_TTL:
+                entry = (time.monotonic(), fetch())
+                self._metadata_cache[key] = entry
+
+            return entry[1]
+
     def _get_client_projects(self, client_id):
         """Get a list of projects for a given client id."""
-        return self.request(Endpoints.CLIENT_PROJECTS(client_id), self.params)
+        # key on the workspace too so switching workspaces never serves stale
+        # projects
+        key = (self.workspace, client_id)
+        # expires like the rest of the metadata
+        entry = self._client_projects_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= METADATA_CACHE_TTL:
+            projects = self.request(Endpoints.CLIENT_PROJECTS(client_id), self.params)
+            entry = (time.monotonic(), projects)
+            self._client_projects_cache[key] = entry
+
+        return entry[1]
@@ -1,15 +1,71 @@
+import contextlib
+import glob
+import json
+import os
+
 import yaml
 
+# libyaml's C loader is several times faster than the pure python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 def load_yml_file(yml, error_message="Error loading yml file."):
     """Load a yml file."""
     try:
         with open(yml, "r") as ymlfile:
-            cfg = yaml.load(ymlfile)
+            cfg = yaml.load(ymlfile, Loader=_Loader)
             return cfg
-    except FileNotFoundError as fe:
+    except FileNotFoundError:
+        raise FileNotFoundError(error_message)
+
+
+def load_cached_yml_file(yml, error_message="Error loading yml file."):
+    """
+    Load a yml file, reusing a json copy of it while the yml is unchanged.
+
+    The json sidecar lives next to the yml and is named after its
+    modification time and size, so editing the yml invalidates it.
+    """
+    try:
+        stat = os.stat(yml)
+    except FileNotFoundError:
         raise FileNotFoundError(error_message)
 
+    directory, filename = os.path.split(yml)
+    stem = os.path.splitext(filename)[0]
+    cache_file = os.path.join(
+        directory, f".{stem}.{stat.st_mtime_ns}.{stat.st_size}.json"
+    )
+
+    with contextlib.suppress(FileNotFoundError, ValueError):
+        with open(cache_file, "r") as jsonfile:
+            return json.load(jsonfile)
+
+    cfg = load_yml_file(yml, error_message=error_message)
+
+    for stale in glob.glob(os.path.join(directory, f".{stem}.*.json")):
+        with contextlib.suppress(OSError):
+            os.remove(stale)
+
+    # not everything yaml can express survives json: dates fail outright,
+    # while int or bool keys (a project named 2019 or yes) quietly become
+    # strings, so only cache what comes back equal
+    try:
+        text = json.dumps(cfg)
+    except (TypeError, ValueError):
+        return cfg
+    if json.loads(text) != cfg:
+        return cfg
+
+    with contextlib.suppress(OSError):
+        with open(cache_file, "w") as jsonfile:
+            jsonfile.write(text)
+
+    return cfg
+
 
 def load_config():
     """Load a config.yml file."""